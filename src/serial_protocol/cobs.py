@@ -1,9 +1,46 @@
 #!/usr/bin/env python3
 
-from typing import Union
+from typing import Iterable, Union
 from serial_protocol.utils import hexstring_to_bytearray
 
 
+def _identity(data: bytearray) -> bytearray:
+    """Returns the input unchanged (bytearray inputs need no conversion)."""
+    return data
+
+
+# Converters from each supported input type to a bytearray, keyed by exact type
+_INPUT_CONVERTERS = {
+    bytearray: _identity,
+    str: hexstring_to_bytearray,
+    list: bytearray,
+}
+
+
+def _to_bytearray(data: Union[str, list, bytearray]) -> bytearray:
+    """
+    Converts supported `encode()`/`decode()` inputs into a bytearray.
+
+    Args:
+        data (Union[str, list, bytearray]): A hex string, list of integers, or bytearray.
+
+    Returns:
+        bytearray: The input as a bytearray.
+
+    Raises:
+        TypeError: If `data` is not one of the supported types.
+    """
+    converter = _INPUT_CONVERTERS.get(type(data))
+    if converter is not None:
+        return converter(data)
+
+    # Subclasses of the supported types miss the exact type lookup
+    for base, base_converter in _INPUT_CONVERTERS.items():
+        if isinstance(data, base):
+            return base_converter(data)
+    raise TypeError("Input data must be a bytearray, list, or hex string.")
+
+
 def encode(data: Union[str, list, bytearray]) -> bytearray:
     """
     Encodes the given data using Consistent Overhead Byte Stuffing (COBS).
@@ -23,14 +60,30 @@ def encode(data: Union[str, list, bytearray]) -> bytearray:
     Raises:
         TypeError: If `data` is not one of the supported types.
     """
-    if isinstance(data, str):
-        data = hexstring_to_bytearray(data)
-    elif isinstance(data, list):
-        data = bytearray(data)
-    elif not isinstance(data, bytearray):
-        raise TypeError("Input data must be a bytearray, list, or hex string.")
+    return encode_bytearray(_to_bytearray(data))
 
-    return encode_bytearray(data)
+
+def encode_many(frames: Iterable[Union[str, list, bytearray]]) -> list[bytearray]:
+    """
+    Encodes several frames using Consistent Overhead Byte Stuffing (COBS).
+
+    This is equivalent to calling `encode()` on each frame, with the function
+    lookups hoisted out of the loop for streams of many small frames.
+
+    Args:
+        frames (Iterable[Union[str, list, bytearray]]): The frames to encode, each
+            of a type accepted by `encode()`.
+
+    Returns:
+        list[bytearray]: The COBS-encoded frames, in input order.
+
+    Raises:
+        TypeError: If any frame is not one of the supported types.
+        ValueError: If any frame is empty.
+    """
+    encode_ = encode_bytearray
+    to_bytearray = _to_bytearray
+    return [encode_(to_bytearray(frame)) for frame in frames]
 
 
 def encode_bytearray(data: bytearray, delimiter: int = 0x00) -> bytearray:
@@ -58,36 +111,39 @@ def encode_bytearray(data: bytearray, delimiter: int = 0x00) -> bytearray:
     if len(data) == 1 and data[0] == 0x00:
         return bytearray([0x01, 0x00]) # special case
 
-    encoded = bytearray([0x00])  # with place holder for first marker
-    zero_block_len = 1  # Length counter for zero markers
-    zero_marker_pos = 0  # Position of the current zero marker
-
-    for byte in data:
-        # Check to see if we need to add an extra byte
-        if zero_block_len == 0xff:
-            # set current zero marker to be 0xff, and add another
-            # zero into encoded data
-            encoded[zero_marker_pos] = 0xff
-            encoded.append(0x00)
-
-            # reset zero marker position and length of this
-            # zero block
-            zero_marker_pos = len(encoded) - 1
-            zero_block_len = 1
-
-        # Now check value of the byte
-        if byte == 0x00:
-            encoded[zero_marker_pos] = zero_block_len
-            encoded.append(0x00)
-            zero_marker_pos = len(encoded) - 1
-            zero_block_len = 1
-        else:
-            encoded.append(byte)
-            zero_block_len += 1
-
-    # Handle the final marker
-    encoded[zero_marker_pos] = zero_block_len
-    encoded.append(0x00)  # Frame delimiter
+    # Preallocate for the worst case (one extra marker per 254 bytes plus
+    # the leading marker and frame delimiter) and trim once at the end
+    length = len(data)
+    encoded = bytearray(length + length // 0xfe + 2)
+    write_idx = 0
+    pos = 0
+    find = data.find
+
+    while True:
+        # Locate the next zero byte with a C-level scan rather than
+        # stepping through the data one byte at a time in Python
+        zero = find(0x00, pos)
+        end = length if zero < 0 else zero
+
+        # Split runs of non-zero bytes into max-length (0xff) blocks. A run
+        # of exactly 254 bytes is only split if another byte follows it.
+        while end - pos > 0xfe or (zero >= 0 and end - pos == 0xfe):
+            encoded[write_idx] = 0xff
+            encoded[write_idx + 1:write_idx + 0xff] = data[pos:pos + 0xfe]
+            write_idx += 0xff
+            pos += 0xfe
+
+        # Zero marker followed by the remaining bytes of the run
+        run_len = end - pos
+        encoded[write_idx] = run_len + 1
+        encoded[write_idx + 1:write_idx + 1 + run_len] = data[pos:end]
+        write_idx += run_len + 1
+        if zero < 0:
+            break
+        pos = zero + 1
+
+    encoded[write_idx] = 0x00  # Frame delimiter
+    del encoded[write_idx + 1:]
     return encoded
 
 
@@ -110,14 +166,7 @@ def decode(data: Union[str, list, bytearray]) -> bytearray:
     Raises:
         TypeError: If `data` is not one of the supported types.
     """
-    if isinstance(data, str):
-        data = hexstring_to_bytearray(data)
-    elif isinstance(data, list):
-        data = bytearray(data)
-    elif not isinstance(data, bytearray):
-        raise TypeError("Input data must be a bytearray, list, or hex string.")
-
-    return decode_bytearray(data)
+    return decode_bytearray(_to_bytearray(data))
 
 
 def decode_bytearray(data: bytearray) -> bytearray:
@@ -148,7 +197,7 @@ def decode_bytearray(data: bytearray) -> bytearray:
     if data[-1] != 0x00:
         raise ValueError("Invalid COBS-encoded data: missing final "
                          "frame delimiter (0x00)")
-    if data.count(0x00) > 1:
+    if data.find(0x00) != len(data) - 1:
         raise ValueError("Invalid COBS-encoded data: more than one "
                          "frame delimiter (0x00)")
 
@@ -156,28 +205,34 @@ def decode_bytearray(data: bytearray) -> bytearray:
     if len(data) == 2 and data[0] == 0x01:
         return bytearray([0x00])
 
-    # Other cases
+    # Other cases. The decoded data is never longer than the encoded data,
+    # so preallocate a zero-filled buffer and trim it once at the end.
+    length = len(data)
+    last_idx = length - 1
+    decoded = bytearray(length)
+    write_idx = 0
     idx = 0
-    decoded = bytearray()
-    while idx < len(data) - 1:
+    while idx < last_idx:
         # first byte will be number of bytes until next delimiter
         bytes_until_delim = data[idx]
 
         # Ensure zero marker does not point beyond the available data
-        if bytes_until_delim + idx >= len(data):
+        if bytes_until_delim + idx >= length:
             raise ValueError("Invalid COBS-encoded data: invalid zero marker")
 
-        # Move to data section
-        idx += 1
-        for _ in range(bytes_until_delim - 1):
-            decoded.append(data[idx])
-            idx += 1
+        # Copy the whole data section of the block in one slice operation
+        block_len = bytes_until_delim - 1
+        decoded[write_idx:write_idx + block_len] = data[idx + 1:idx + bytes_until_delim]
+        write_idx += block_len
+        idx += bytes_until_delim
 
         # Insert zero unless this was a max-length block (0xff)
-        # or at the end of the data
+        # or at the end of the data. The buffer is already zero-filled,
+        # so inserting a zero only requires advancing the write index.
         overhead_byte = bytes_until_delim == 0xff
-        data_left_to_decode = idx < len(data) - 1
+        data_left_to_decode = idx < last_idx
         if not overhead_byte and data_left_to_decode:
-            decoded.append(0x00)
+            write_idx += 1
 
+    del decoded[write_idx:]
     return decoded
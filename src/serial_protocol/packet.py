@@ -2,7 +2,8 @@
 
 import crc
 from dataclasses import dataclass
-from typing import Union, Optional
+from enum import Enum
+from typing import Iterable, Union, Optional
 from serial_protocol import tlv, cobs, utils
 
 
@@ -45,12 +46,26 @@ class SerialPacket:
         >>> encoded = pkt.encode(1, 42, ValueFormat.UINT8)
     """
 
+    __slots__ = ("_tlv_packet", "_crc_calc", "_crc_format", "_crc_num_bytes", "_crc_struct")
+
     def __init__(self, max_data_length: Union[utils.ValueFormat, str] = utils.ValueFormat.UINT8,
                  crc_=crc.Crc16.XMODEM,
                  crc_format: utils.ValueFormat = utils.ValueFormat.UINT16):
         self._tlv_packet = tlv.TLVPacket(max_data_length)
-        self._crc_calc = crc.Calculator(crc_)
-        self._crc_format = crc_format
+        # Table-driven register: one lookup per byte instead of a bit-by-bit loop
+        self._crc_calc = crc.Calculator(crc_, optimized=True)
+        self._crc_format = utils.ValueFormat.coerce(crc_format)
+        if self._crc_format not in utils.UINT_FORMATS:
+            raise ValueError("The CRC format must be of category uint "
+                             f"not {self._crc_format.category}")
+        crc_config = crc_.value if isinstance(crc_, Enum) else crc_
+        if 2**crc_config.width - 1 > self._crc_format.max_value:
+            raise ValueError(f"A {crc_config.width}-bit CRC does not fit in the CRC format "
+                             f"{self._crc_format.label}")
+
+        # Cache the checksum width and packer so they are not rederived per packet
+        self._crc_num_bytes = self._crc_format.num_bytes
+        self._crc_struct = self._crc_format.pack_struct
 
     def encode(self,
                data_: Union[int, SerialPacketStruct],
@@ -80,6 +95,98 @@ class SerialPacket:
         raise ValueError("The data_ argument must be of type int or "
                          f"SerialPacketStruct not {type(data_)}")
 
+    def encode_batch(self,
+                     packets: Iterable[SerialPacketStruct],
+                     cobs_encode: bool = False) -> list[bytearray]:
+        """
+        Encode multiple serial packets in a single call.
+
+        This is equivalent to calling `encode()` for each packet structure, but avoids the
+        per-call argument dispatch, which dominates the cost for small, high-rate packets.
+
+        Args:
+            packets (Iterable[SerialPacketStruct]): The packet structures to encode.
+            cobs_encode (bool): Whether to apply COBS encoding to every packet (default: False).
+
+        Returns:
+            list[bytearray]: The encoded serial packets, in input order.
+
+        Raises:
+            ValueError: If any item is not a SerialPacketStruct.
+        """
+        encoded = []
+        append = encoded.append
+        encode_ = self._encode
+        for data_ in packets:
+            if not isinstance(data_, SerialPacketStruct):
+                raise ValueError("Each packet must be of type SerialPacketStruct "
+                                 f"not {type(data_)}")
+            append(encode_(data_.type_, data_.value_, data_.format_,
+                           data_.device_id, cobs_encode))
+        return encoded
+
+    def encode_into(self,
+                    buffer: bytearray,
+                    offset: int,
+                    data_: Union[int, SerialPacketStruct],
+                    value_: Union[int, float, bytearray] = None,
+                    format_: utils.ValueFormat = None,
+                    device_id: int = None,
+                    cobs_encode: bool = False) -> int:
+        """
+        Encode a serial packet directly into a caller-provided buffer.
+
+        Takes the same packet arguments as `encode()`. Without COBS the device ID, TLV fields
+        and checksum are written straight into `buffer`, so one buffer can be reused across
+        packets instead of allocating several bytearrays per packet. COBS frames are encoded
+        separately and then copied in.
+
+        Args:
+            buffer (bytearray): Writable buffer to encode the packet into.
+            offset (int): Index in `buffer` at which the packet starts.
+            data_ (int or SerialPacketStruct): Type ID or full packet structure.
+            value_ (int|float|bytearray, optional): Payload (if not using a struct).
+            format_ (ValueFormat, optional): Format used to encode the value (if not using a struct).
+            device_id (int, optional): Optional device ID byte to prepend (if not using a struct).
+            cobs_encode (bool): Whether to apply COBS encoding (default: False).
+
+        Returns:
+            int: The index in `buffer` immediately after the encoded packet.
+
+        Raises:
+            ValueError: If the packet does not fit in `buffer` at `offset`, or any field is invalid.
+        """
+        if isinstance(data_, SerialPacketStruct):
+            type_, value_, format_, device_id = data_.type_, data_.value_, data_.format_, data_.device_id
+        elif isinstance(data_, int):
+            type_ = data_
+        else:
+            raise ValueError("The data_ argument must be of type int or "
+                             f"SerialPacketStruct not {type(data_)}")
+
+        if cobs_encode:
+            packet_ = self._encode(type_, value_, format_, device_id, cobs_encode)
+            end = offset + len(packet_)
+            utils._check_buffer_fits(buffer, offset, end)
+            buffer[offset:end] = packet_
+            return end
+
+        # Validate everything up front so nothing is written if the packet does not fit
+        tlv_packet = self._tlv_packet
+        type_, value_ = tlv_packet._validate_and_convert_fields(type_, value_, format_)
+        tlv_start = offset if device_id is None else offset + 1
+        checksum_idx = tlv_start + 1 + tlv_packet._num_len_bytes + len(value_)
+        end = checksum_idx + self._crc_num_bytes
+        utils._check_buffer_fits(buffer, offset, end)
+
+        if device_id is not None:
+            buffer[offset] = device_id
+        tlv_packet._write_fields(buffer, tlv_start, type_, value_)
+        with memoryview(buffer) as view:
+            checksum = self._crc_calc.checksum(view[offset:checksum_idx])
+        self._crc_struct.pack_into(buffer, checksum_idx, checksum)
+        return end
+
     def decode(self,
                data_: bytearray,
                format_: utils.ValueFormat = None,
@@ -115,16 +222,17 @@ class SerialPacket:
 
         data_ = cobs.decode(data_) if cobs_encoded else data_
         data_ = self._verify_and_extract_checksum(data_)
+        offset = 0
         if device_id:
             retval.device_id = data_[0]
-            data_ = data_[1:]
+            offset = 1
 
         # Validate length
-        num_len_bytes = self._validate_data_length(data_)
+        num_len_bytes = self._validate_data_length(data_, offset)
 
         # Extract Data
-        retval.type_ = data_[0]
-        retval.value_ = data_[1+num_len_bytes:]
+        retval.type_ = data_[offset]
+        retval.value_ = data_[offset+1+num_len_bytes:]
 
         # Convert value to format if specified
         if format_ is not None:
@@ -142,15 +250,15 @@ class SerialPacket:
         """
         Internal implementation of the encode logic with all components unpacked.
         """
-        # TLV encode packet and preprend device ID if supplied
+        # TLV encode packet and preprend device ID if supplied. The TLV
+        # packet is a fresh bytearray, so it is extended in place rather
+        # than copied into a new buffer for each added field.
         packet_ = self._tlv_packet.encode(type_, value_, format_)
         if device_id is not None:
-            packet_ = bytearray([device_id]) + packet_
+            packet_.insert(0, device_id)
 
         # Calculate checksum and add to packet
-        checksum = self._crc_calc.checksum(packet_)
-        checksum = utils.int_to_bytearray(checksum, self._crc_format)
-        packet_ = packet_ + checksum
+        packet_ += self._crc_struct.pack(self._crc_calc.checksum(packet_))
 
         # Cobs encode packet if enabled
         if cobs_encode:
@@ -170,20 +278,26 @@ class SerialPacket:
         Raises:
             ValueError: If checksum does not match.
         """
-        num_bytes = self._crc_format.num_bytes
-        sent_checksum = data_[-num_bytes:]
-        data_ = data_[:-num_bytes]
+        checksum_idx = len(data_) - self._crc_num_bytes
+        if checksum_idx < 0:
+            raise ValueError("Packet too short to contain a checksum "
+                             f"(got {len(data_)} bytes).")
+
+        # Compare checksums as integers, read in place from the packet
+        sent_checksum = self._crc_struct.unpack_from(data_, checksum_idx)[0]
+        data_ = data_[:checksum_idx]
         checksum = self._crc_calc.checksum(data_)
-        expected = utils.int_to_bytearray(checksum, self._crc_format)
 
-        if expected != sent_checksum:
+        if checksum != sent_checksum:
+            received = self._crc_struct.pack(sent_checksum)
+            expected = self._crc_struct.pack(checksum)
             raise ValueError("Checksum verification failed. "
-                             f"Received: {utils.bytearray_to_hexstring(sent_checksum)}, "
+                             f"Received: {utils.bytearray_to_hexstring(received)}, "
                              f"Expected: {utils.bytearray_to_hexstring(expected)}")
 
         return data_
 
-    def _validate_data_length(self, data_: bytearray) -> int:
+    def _validate_data_length(self, data_: bytearray, offset: int = 0) -> int:
         """
         Validates that the length field in the TLV header matches the actual payload length.
 
@@ -191,7 +305,8 @@ class SerialPacket:
             [type (1 byte)] [length (N bytes)] [value (length bytes)]
 
         Args:
-            data_ (bytearray): The TLV-encoded packet data (excluding device ID and checksum).
+            data_ (bytearray): The packet data (excluding checksum).
+            offset (int): Index of the TLV type field within `data_` (1 if a device ID is present).
 
         Returns:
             int: Number of bytes used by the length field (derived from max_data_length format).
@@ -199,10 +314,16 @@ class SerialPacket:
         Raises:
             ValueError: If the length field does not match the actual value length.
         """
-        max_data_length = self._tlv_packet.max_data_length
-        num_len_bytes = max_data_length.num_bytes
-        length_field = utils.bytearray_to_int(data_[1:1+num_len_bytes], "little")
-        if length_field != len(data_) - 1 - num_len_bytes:
+        # Read the length field layout cached by the TLV packet rather than
+        # going through its max_data_length property per packet
+        tlv_packet = self._tlv_packet
+        num_len_bytes = tlv_packet._num_len_bytes
+        payload_length = len(data_) - offset - 1 - num_len_bytes
+        if payload_length < 0:
+            raise ValueError("Invalid length")
+
+        length_field = tlv_packet._len_struct.unpack_from(data_, offset + 1)[0]
+        if length_field != payload_length:
             raise ValueError("Invalid length")
 
         return num_len_bytes
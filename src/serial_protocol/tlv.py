@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 
-from enum import Enum
-from typing import Union
+import struct
+from typing import Iterable, Union
 from serial_protocol import utils
 
+# Packers for the common (Python type, ValueFormat) pairs, looked up by exact value type
+_VALUE_PACKERS = {
+    (int if format_.is_uint() else float, format_): format_.pack_struct.pack
+    for format_ in utils.ValueFormat
+}
+
 
 class TLVPacket:
     """
@@ -19,6 +25,9 @@ class TLVPacket:
         (1, 2, 300)
     """
 
+    __slots__ = ("__max_data_length", "_num_len_bytes", "_max_len", "_len_struct", "_header_struct",
+                 "_packet_structs")
+
     def __init__(self,
                  max_data_length: utils.ValueFormat = utils.ValueFormat.UINT8):
         """
@@ -30,10 +39,7 @@ class TLVPacket:
         Raises:
             ValueError: If the format is not an unsigned integer type.
         """
-        self.__max_data_length = utils.ValueFormat.coerce(max_data_length)
-        if not self.max_data_length.is_uint():
-            raise ValueError("The max data length must be of category uint "
-                             f"not {self.max_data_length.category}")
+        self.max_data_length = max_data_length
 
     @property
     def max_data_length(self) -> utils.ValueFormat:
@@ -42,7 +48,22 @@ class TLVPacket:
 
     @max_data_length.setter
     def max_data_length(self, value: utils.ValueFormat):
-        self.__max_data_length = utils.ValueFormat.coerce(value)
+        value = utils.ValueFormat.coerce(value)
+        if value not in utils.UINT_FORMATS:
+            raise ValueError("The max data length must be of category uint "
+                             f"not {value.category}")
+        self.__max_data_length = value
+        # Cached so encode/decode do not go through the enum properties per packet
+        self._num_len_bytes = value.num_bytes
+        self._max_len = value.max_value
+        self._len_struct = value.pack_struct
+        # Type byte and length field packed together, e.g. '<BH' for a UINT16 length
+        self._header_struct = struct.Struct("<B" + value.pack_struct.format[1:])
+        # Whole-packet layouts for plain int/float values, keyed like _VALUE_PACKERS
+        self._packet_structs = {
+            key: struct.Struct(self._header_struct.format + key[1].pack_struct.format[1:])
+            for key in _VALUE_PACKERS
+        }
 
     def encode(self,
                type_: Union[int, bytearray],
@@ -63,29 +84,142 @@ class TLVPacket:
             >>> TLVPacket().encode(1, 42)
             bytearray(b'\\x01\\x01\\x00\\x2a')
         """
-        type_ = self._validate_and_convert_type(type_)
-        value_ = self._validate_and_convert_value(value_, format_)
-        length_ = utils.int_to_bytearray(len(value_), self.max_data_length)
+        # Fast path: an in-range int type and a plain int/float value are packed
+        # as a whole packet with one precompiled struct
+        packet_struct = self._fast_packet_struct(type_, value_, format_)
+        if packet_struct is not None:
+            packet = bytearray(packet_struct.size)
+            utils._pack_checked(packet_struct.pack_into, format_, packet, 0, type_, format_.num_bytes, value_)
+            return packet
+
+        type_, value_ = self._validate_and_convert_fields(type_, value_, format_)
+        packet = bytearray(1 + self._num_len_bytes + len(value_))
+        self._write_fields(packet, 0, type_, value_)
+        return packet
+
+    def encode_bytes(self,
+                     type_: Union[int, bytearray],
+                     value_: Union[int, float, bytearray],
+                     format_: utils.ValueFormat) -> bytes:
+        """
+        Encode a TLV packet as immutable bytes.
+
+        Produces the same packet as `encode()`, but skips the mutable bytearray for callers
+        that only write the packet out (e.g. to a serial port or socket).
+
+        Args:
+            type_ (int | bytearray): Type field (must fit in one byte).
+            value_ (int | float | bytearray): Value field to encode.
+            format_ (ValueFormat): Format of the value.
+
+        Returns:
+            bytes: Encoded TLV packet.
+
+        Example:
+            >>> TLVPacket().encode_bytes(1, 42, ValueFormat.UINT8)
+            b'\\x01\\x01*'
+        """
+        packet_struct = self._fast_packet_struct(type_, value_, format_)
+        if packet_struct is not None:
+            return utils._pack_checked(packet_struct.pack, format_, type_, format_.num_bytes, value_)
+
+        type_, value_ = self._validate_and_convert_fields(type_, value_, format_)
+        return self._header_struct.pack(type_, len(value_)) + value_
+
+    def encode_into(self,
+                    buffer: bytearray,
+                    offset: int,
+                    type_: Union[int, bytearray],
+                    value_: Union[int, float, bytearray],
+                    format_: utils.ValueFormat) -> int:
+        """
+        Encode a TLV packet directly into a caller-provided buffer.
+
+        This allows a single buffer to be reused across many packets instead of
+        allocating a new bytearray for each one.
+
+        Args:
+            buffer (bytearray): Writable buffer to encode the packet into.
+            offset (int): Index in `buffer` at which the packet starts.
+            type_ (int | bytearray): Type field (must fit in one byte).
+            value_ (int | float | bytearray): Value field to encode.
+            format_ (ValueFormat): Format of the value.
+
+        Returns:
+            int: The index in `buffer` immediately after the encoded packet.
+
+        Raises:
+            ValueError: If the packet does not fit in `buffer` at `offset`.
+
+        Example:
+            >>> buf = bytearray(8)
+            >>> TLVPacket().encode_into(buf, 0, 1, 42, ValueFormat.UINT8)
+            3
+        """
+        type_, value_ = self._validate_and_convert_fields(type_, value_, format_)
+        end = offset + 1 + self._num_len_bytes + len(value_)
+        utils._check_buffer_fits(buffer, offset, end)
+
+        return self._write_fields(buffer, offset, type_, value_)
+
+    def encode_many(self,
+                    types: Iterable[Union[int, bytearray]],
+                    values: Iterable[Union[int, float, bytearray]],
+                    format_: utils.ValueFormat) -> bytearray:
+        """
+        Encode several TLV packets sharing a value format into one contiguous buffer.
+
+        All packets are validated first and then written back to back into a single
+        preallocated bytearray, so the output is allocated once for the whole batch.
+
+        Args:
+            types (Iterable[int | bytearray]): Type field of each packet.
+            values (Iterable[int | float | bytearray]): Value field of each packet.
+            format_ (ValueFormat): Format of every value.
+
+        Returns:
+            bytearray: The encoded packets concatenated in input order.
+
+        Raises:
+            ValueError: If `types` and `values` differ in length, or any field is invalid.
 
-        return bytearray(type_ + length_ + value_)
+        Example:
+            >>> TLVPacket().encode_many([1, 2], [42, 7], ValueFormat.UINT8)
+            bytearray(b'\\x01\\x01*\\x02\\x01\\x07')
+        """
+        fields = [self._validate_and_convert_fields(type_, value_, format_)
+                  for type_, value_ in zip(types, values, strict=True)]
+
+        header_len = 1 + self._num_len_bytes
+        buffer = bytearray(sum(header_len + len(value_) for _, value_ in fields))
+        offset = 0
+        for type_, value_ in fields:
+            offset = self._write_fields(buffer, offset, type_, value_)
+        return buffer
 
     def decode(self,
-               packet: bytearray,
-               value_format: utils.ValueFormat | None = None
-               ) -> tuple[int, int, Union[int, float, bytearray]]:
+               packet: Union[bytearray, bytes, memoryview],
+               value_format: utils.ValueFormat | None = None,
+               copy: bool = True
+               ) -> tuple[int, int, Union[int, float, bytearray, memoryview]]:
         """
         Decode a TLV packet and extract type, length, and value.
 
         Args:
-            packet (bytearray): The TLV packet to decode.
+            packet (bytearray | bytes | memoryview): The TLV packet to decode. Any object
+                                                     supporting the buffer protocol is accepted.
             value_format (ValueFormat, optional): If provided, decode the value accordingly.
-                                                If None, the value is returned as a raw bytearray.
+                                                If None, the value is returned as raw bytes.
+            copy (bool): Only used when `value_format` is None. If True (default) the raw value
+                         is returned as a new bytearray. If False it is returned as a zero-copy
+                         memoryview that aliases `packet`, so later changes to `packet` are
+                         visible through it.
 
         Returns:
-            tuple[int, int, int|float|bytearray]: (type, length, decoded value)
+            tuple[int, int, int|float|bytearray|memoryview]: (type, length, decoded value)
 
         Raises:
-            TypeError: If input is not a bytearray.
+            TypeError: If input is not a bytes-like object.
             ValueError: If packet structure is invalid or decoding fails.
 
         Example:
@@ -94,15 +228,21 @@ class TLVPacket:
             >>> tlv.decode(pkt, ValueFormat.FLOAT32)
             (1, 4, 3.14)
         """
-        if not isinstance(packet, bytearray):
-            raise TypeError(f"Expected bytearray for packet, got {type(packet).__name__}")
-
-        num_len_bytes = self.max_data_length.num_bytes
+        is_bytearray = type(packet) is bytearray
+        if not is_bytearray:
+            # Read other buffer-protocol objects (bytes, mmap, bytearray subclasses, ...)
+            # through a byte view so the caller does not have to copy them into a bytearray
+            try:
+                packet = memoryview(packet).cast("B")
+            except TypeError:
+                raise TypeError("Expected a bytes-like object for packet, "
+                                f"got {type(packet).__name__}") from None
+
+        num_len_bytes = self._num_len_bytes
         if len(packet) < 1 + num_len_bytes:
             raise ValueError(f"Packet too short to contain a valid TLV header (got {len(packet)} bytes).")
 
-        type_ = int(packet[0])
-        length_ = int.from_bytes(packet[1:num_len_bytes + 1], byteorder='little')
+        type_, length_ = self._header_struct.unpack_from(packet)
         expected_total_len = 1 + num_len_bytes + length_
 
         if len(packet) != expected_total_len:
@@ -111,58 +251,253 @@ class TLVPacket:
                 f"(type={type_}, length field={length_}), got {len(packet)} bytes."
             )
 
-        value_bytes = packet[num_len_bytes + 1:]
-
         # Handle decoding based on ValueFormat
-        if value_format is None:
-            value_ = value_bytes
+        value_start = num_len_bytes + 1
+        if value_format is None and not copy:
+            value_ = memoryview(packet)[value_start:]
+        elif value_format is None:
+            value_ = packet[value_start:] if is_bytearray else bytearray(packet[value_start:])
         else:
-            value_ = utils.bytearray_to_value(value_bytes, value_format)
+            if not isinstance(value_format, utils.ValueFormat):
+                value_format = utils.ValueFormat.coerce(value_format)
+            if value_format in utils.UINT_FORMATS:
+                value_ = int.from_bytes(packet[value_start:], byteorder="little")
+            elif length_ != value_format.num_bytes:
+                raise ValueError(
+                    f"Expected {value_format.num_bytes} bytes for float format "
+                    f"{value_format.label}, got {length_} bytes."
+                )
+            else:
+                # Read the float in place rather than slicing out its bytes first
+                value_ = value_format.pack_struct.unpack_from(packet, value_start)[0]
 
         return type_, length_, value_
 
-    def _validate_and_convert_type(self, type_: Union[int, bytearray]) -> bytearray:
+    def decode_many(self,
+                    stream: Union[bytearray, bytes, memoryview],
+                    value_format: utils.ValueFormat | None = None,
+                    copy: bool = True
+                    ) -> list[tuple[int, int, Union[int, float, bytearray, memoryview]]]:
+        """
+        Decode several TLV packets laid out back to back in one buffer.
+
+        This is the inverse of `encode_many()`. Packet boundaries are found from each length
+        field and every packet is decoded through a zero-copy view of `stream`.
+
+        Args:
+            stream (bytearray | bytes | memoryview): Concatenated TLV packets.
+            value_format (ValueFormat, optional): If provided, decode every value accordingly.
+            copy (bool): Passed to `decode()` for raw values (see `decode()`).
+
+        Returns:
+            list[tuple[int, int, int|float|bytearray|memoryview]]: (type, length, value) per packet.
+
+        Raises:
+            TypeError: If `stream` is not a bytes-like object.
+            ValueError: If a packet is truncated or cannot be decoded.
+
+        Example:
+            >>> tlv = TLVPacket()
+            >>> tlv.decode_many(tlv.encode_many([1, 2], [42, 7], ValueFormat.UINT8), ValueFormat.UINT8)
+            [(1, 1, 42), (2, 1, 7)]
+        """
+        try:
+            view = memoryview(stream).cast("B")
+        except TypeError:
+            raise TypeError("Expected a bytes-like object for stream, "
+                            f"got {type(stream).__name__}") from None
+
+        header_len = 1 + self._num_len_bytes
+        unpack_length = self._len_struct.unpack_from
+        stream_len = len(view)
+        packets = []
+        offset = 0
+        while offset < stream_len:
+            if offset + header_len > stream_len:
+                raise ValueError(f"Truncated TLV header at offset {offset}.")
+            end = offset + header_len + unpack_length(view, offset + 1)[0]
+            if end > stream_len:
+                raise ValueError(f"Truncated TLV value at offset {offset}: packet needs "
+                                 f"{end - offset} bytes, {stream_len - offset} available.")
+            packets.append(self.decode(view[offset:end], value_format, copy))
+            offset = end
+        return packets
+
+    def _fast_packet_struct(self,
+                            type_: Union[int, bytearray],
+                            value_: Union[int, float, bytearray],
+                            format_: utils.ValueFormat) -> struct.Struct | None:
+        """
+        Return the whole-packet struct if the fields can be packed in one call, else None.
+
+        Only an in-range int type with a plain int/float value and an enum format qualifies.
+        """
+        packet_struct = self._packet_structs.get((type(value_), format_))
+        if packet_struct is not None and type(type_) is int and 0 <= type_ <= 255:
+            return packet_struct
+        return None
+
+    def _validate_and_convert_fields(self,
+                                     type_: Union[int, bytearray],
+                                     value_: Union[int, float, bytearray],
+                                     format_: utils.ValueFormat) -> tuple[int, Union[bytes, bytearray]]:
+        """
+        Validate and convert the type and value fields, checking the value fits the length field.
+
+        Returns:
+            tuple[int, bytes|bytearray]: (type, encoded value)
+
+        Raises:
+            ValueError: If the value is longer than `max_data_length` can describe.
+        """
+        type_ = self._validate_and_convert_type(type_)
+        value_ = self._validate_and_convert_value(value_, format_)
+        if len(value_) > self._max_len:
+            raise ValueError(f"Value length {len(value_)} exceeds the maximum of {self._max_len} "
+                             f"bytes for max data length {self.max_data_length.label}.")
+        return type_, value_
+
+    def _write_fields(self,
+                      buffer: bytearray,
+                      offset: int,
+                      type_: int,
+                      value_: Union[bytes, bytearray]) -> int:
         """
-        Validate and convert the type field to a single-byte bytearray.
+        Write already validated TLV fields into `buffer` starting at `offset`.
+
+        Returns:
+            int: The index in `buffer` immediately after the written packet.
+        """
+        value_start = offset + 1 + self._num_len_bytes
+        end = value_start + len(value_)
+        self._header_struct.pack_into(buffer, offset, type_, len(value_))
+        buffer[value_start:end] = value_
+        return end
+
+    def _validate_and_convert_type(self, type_: Union[int, bytearray]) -> int:
+        """
+        Validate and convert the type field to a single-byte integer.
 
         Example:
-            >>> TLVPacket()._validate_and_convert_type(5)
-            bytearray(b'\\x05')
+            >>> TLVPacket()._validate_and_convert_type(bytearray([5]))
+            5
         """
         if isinstance(type_, int):
             if not (0 <= type_ <= 255):
                 raise ValueError("Input type_ must be in the range [0, 255].")
-            return bytearray([type_])
+            return type_
         if isinstance(type_, bytearray):
             if len(type_) != 1:
                 raise ValueError("Input type_ must be exactly 1 byte.")
-            return type_
+            return type_[0]
 
         raise TypeError("Input type_ must be an integer or a 1-byte bytearray.")
 
     def _validate_and_convert_value(self,
                                     value_: Union[int, float, bytearray],
-                                    format_: utils.ValueFormat) -> bytearray:
+                                    format_: utils.ValueFormat) -> Union[bytes, bytearray]:
         """
-        Validate and convert the value to a bytearray.
+        Validate and convert the value to its encoded bytes.
 
         Example:
             >>> TLVPacket()._validate_and_convert_value(42, ValueFormat.UINT8)
-            bytearray(b'*')
+            b'*'
         """
-        format_ = utils.ValueFormat.coerce(format_)
+        if not isinstance(format_, utils.ValueFormat):
+            format_ = utils.ValueFormat.coerce(format_)
+
+        # Fast path: a single dict lookup covers plain ints and floats
+        packer = _VALUE_PACKERS.get((type(value_), format_))
+        if packer is not None:
+            return utils._pack_checked(packer, format_, value_)
 
         if isinstance(value_, bytearray):
             return value_
 
-        if format_.is_float():
+        if format_ in utils.FLOAT_FORMATS:
             if not isinstance(value_, float):
                 raise TypeError(f"Expected float for format {format_.label}, got {type(value_).__name__}")
-            return utils.float_to_bytearray(value_, format_)
+            return utils._pack_checked(format_.pack_struct.pack, format_, value_)
 
-        if format_.is_uint():
+        if format_ in utils.UINT_FORMATS:
             if not isinstance(value_, int):
                 raise TypeError(f"Expected integer for format {format_.label}, got {type(value_).__name__}")
-            return utils.int_to_bytearray(value_, format_)
+            if not (0 <= value_ <= format_.max_value):
+                raise ValueError(f"Value must be in range [0, {format_.max_value}].")
+            return format_.pack_struct.pack(value_)
 
         raise TypeError(f"Unsupported format type: {format_.label}")
+
+
+class TLVEncoder:
+    """
+    TLV encoder specialised for a fixed type field and value format.
+
+    Streams that send many packets with the same type and format can use this instead of
+    `TLVPacket.encode`. The header and value are packed by a single precompiled `struct.Struct`
+    built for the fixed layout, so each int or float value is encoded with one C-level call.
+
+    Example:
+        >>> encoder = TLVEncoder(1, ValueFormat.UINT16)
+        >>> encoder.encode(300)
+        bytearray(b'\\x01\\x02,\\x01')
+    """
+
+    __slots__ = ("_tlv_packet", "_type", "_format", "_value_type", "_packet_struct")
+
+    def __init__(self,
+                 type_: Union[int, bytearray],
+                 format_: utils.ValueFormat,
+                 max_data_length: utils.ValueFormat = utils.ValueFormat.UINT8):
+        """
+        Initialize a fixed-layout TLV encoder.
+
+        Args:
+            type_ (int | bytearray): Type field used for every packet (must fit in one byte).
+            format_ (ValueFormat): Format of every value.
+            max_data_length (ValueFormat): Format used to encode the length field.
+
+        Raises:
+            ValueError: If the type, format or max data length is invalid.
+        """
+        self._tlv_packet = TLVPacket(max_data_length)
+        self._type = self._tlv_packet._validate_and_convert_type(type_)
+        self._format = utils.ValueFormat.coerce(format_)
+        self._value_type = int if self._format.is_uint() else float
+
+        # Whole-packet layout, e.g. '<BBH' for a UINT8 length and UINT16 value
+        self._packet_struct = self._tlv_packet._packet_structs[(self._value_type, self._format)]
+
+    @property
+    def type_(self) -> int:
+        """Type field used for every packet."""
+        return self._type
+
+    @property
+    def format_(self) -> utils.ValueFormat:
+        """Format of every value."""
+        return self._format
+
+    @property
+    def max_data_length(self) -> utils.ValueFormat:
+        """Format used to encode the length field."""
+        return self._tlv_packet.max_data_length
+
+    def encode(self, value_: Union[int, float, bytearray]) -> bytearray:
+        """
+        Encode a value as a TLV packet using the fixed type and format.
+
+        Args:
+            value_ (int | float | bytearray): Value field to encode.
+
+        Returns:
+            bytearray: Encoded TLV packet, identical to `TLVPacket.encode` with the same arguments.
+        """
+        if type(value_) is not self._value_type:
+            # Raw bytearrays, subclasses and invalid types take the general path
+            return self._tlv_packet.encode(self._type, value_, self._format)
+
+        packet = bytearray(self._packet_struct.size)
+        utils._pack_checked(self._packet_struct.pack_into, self._format,
+                            packet, 0, self._type, self._format.num_bytes, value_)
+        return packet
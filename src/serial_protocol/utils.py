@@ -3,12 +3,15 @@
 
 import struct
 from enum import Enum
-from typing import Union
+from typing import Sequence, Union
 
 ########################
 # --- ENUM HELPERS --- #
 ########################
 
+# `struct` format characters for the unsigned integer widths
+_UINT_FORMAT_CHARS = {1: "B", 2: "H", 4: "I"}
+
 
 class ValueFormat(Enum):
     """
@@ -19,6 +22,10 @@ class ValueFormat(Enum):
     - Category: either 'uint' or 'float'
     - A descriptive label (e.g., 'uint16')
     - A format character used by `struct` (only for float types)
+    - A maximum value (only for uint types, None for floats)
+
+    Each member also provides a precompiled little-endian `struct.Struct` used to pack/unpack
+    a single value via the `pack_struct` property. All of these are read-only.
 
     Example:
         >>> ValueFormat.FLOAT32.num_bytes
@@ -32,32 +39,46 @@ class ValueFormat(Enum):
     FLOAT32 = (4, "float", "float32", 'f')
     FLOAT64 = (8, "float", "float64", 'd')
 
+    def __init__(self, num_bytes: int, category: str, label: str, format_char: str):
+        # Derived once per member into private fields, so the read-only properties
+        # below are plain lookups rather than indexing `self.value` per encode/decode
+        self._num_bytes = num_bytes
+        self._category = category
+        self._label = label
+        self._format_char = format_char
+        self._max_value = 2**(num_bytes * 8) - 1 if category == "uint" else None
+        # Built once here so callers never re-parse a struct format string per value
+        self._pack_struct = struct.Struct("<" + (format_char or _UINT_FORMAT_CHARS[num_bytes]))
+
     @property
     def num_bytes(self) -> int:
         """Number of bytes used to store the value."""
-        return self.value[0]
+        return self._num_bytes
 
     @property
     def category(self) -> str:
         """The category of the value type: 'uint' or 'float'."""
-        return self.value[1]
+        return self._category
 
     @property
     def label(self) -> str:
         """A human-readable string label for the format."""
-        return self.value[2]
+        return self._label
 
     @property
     def format_char(self) -> str:
         """Struct format character used for float encoding/decoding."""
-        return self.value[3]
+        return self._format_char
 
     @property
     def max_value(self) -> int:
         """Maximum value (only valid for unsigned int types)."""
-        if self.is_uint():
-            return 2**(self.num_bytes * 8) - 1
-        return None
+        return self._max_value
+
+    @property
+    def pack_struct(self) -> struct.Struct:
+        """Precompiled little-endian `struct.Struct` that packs/unpacks a single value."""
+        return self._pack_struct
 
     def is_uint(self) -> bool:
         """Return True if format represents an unsigned integer."""
@@ -83,15 +104,33 @@ class ValueFormat(Enum):
         """
         if isinstance(value, cls):
             return value
-        for member in cls:
-            if value == member.label:
-                return member
-        raise ValueError(f"Invalid value for {cls.__name__}: {value}")
+        member = _FORMATS_BY_LABEL.get(value) if isinstance(value, str) else None
+        if member is None:
+            raise ValueError(f"Invalid value for {cls.__name__}: {value}")
+        return member
 
     def __str__(self):
         return self.label
 
 
+# Category membership sets, so per-value code can test `format_ in UINT_FORMATS`
+# instead of calling the `is_uint()`/`is_float()` methods
+UINT_FORMATS = frozenset(member for member in ValueFormat if member.is_uint())
+FLOAT_FORMATS = frozenset(member for member in ValueFormat if member.is_float())
+
+# Label lookup for `ValueFormat.coerce`, avoiding a scan over the members per call
+_FORMATS_BY_LABEL = {member.label: member for member in ValueFormat}
+
+# Big-endian counterparts for the float formats (see `float_to_bytearray`)
+_BIG_ENDIAN_FLOAT_STRUCTS = {
+    ValueFormat.FLOAT32: struct.Struct(">f"),
+    ValueFormat.FLOAT64: struct.Struct(">d"),
+}
+
+# Zero-padded decimal text for every byte value, so formatting is a table lookup
+_DEC_STRINGS = tuple(f"{i:03d}" for i in range(256))
+
+
 ##########################
 # --- FORMAT HELPERS --- #
 ##########################
@@ -117,11 +156,20 @@ def is_0x_format(hex_string: str) -> bool:
         >>> is_0x_format("0x01 02")
         ValueError
     """
-    tokens = hex_string.split()
-    has_0x = [token.startswith("0x") for token in tokens]
-    if all(has_0x):
+    return _is_0x_tokens(hex_string.split())
+
+
+def _is_0x_tokens(tokens: list[str]) -> bool:
+    """
+    Implements `is_0x_format()` on an already split token list, so callers that
+    also need the tokens only split the string once.
+    """
+    # Rejoin with single-space separators so every token start is preceded by
+    # a space, then count prefixed tokens with one C-level scan
+    num_0x = (" " + " ".join(tokens)).count(" 0x")
+    if num_0x == len(tokens):
         return True
-    if any(has_0x):
+    if num_0x:
         raise ValueError("The hex string contains mixed '0x' and plain hex formats.")
     return False
 
@@ -130,12 +178,66 @@ def is_0x_format(hex_string: str) -> bool:
 # --- CONVERSION HELPERS --- #
 ##############################
 
+def _as_byte_buffer(value: Union[bytearray, bytes, memoryview]) -> Union[bytearray, memoryview]:
+    """
+    Returns a bytearray unchanged, or a byte view over any other buffer-protocol object.
+
+    Raises:
+        TypeError: If `value` does not support the buffer protocol.
+    """
+    if type(value) is bytearray:
+        return value
+    try:
+        return memoryview(value).cast("B")
+    except TypeError:
+        raise TypeError("Input value must be a bytes-like object, "
+                        f"got {type(value).__name__}.") from None
+
+
+def _pack_checked(pack, format_: ValueFormat, *args):
+    """
+    Calls a struct `pack`/`pack_into` function whose last argument is a value of `format_`,
+    reporting a value that cannot be packed as a ValueError or TypeError.
+
+    Raises:
+        ValueError: If a uint value is out of range, or a float is too large for FLOAT32
+                    (the standard-size '<f'/'>f' formats reject values that would become inf).
+        TypeError: If the value is not an integer (uint formats) or a float (float formats).
+    """
+    try:
+        return pack(*args)
+    except struct.error:
+        # struct only says the value could not be packed; tell a uint range failure
+        # apart from a value of the wrong type
+        value = args[-1]
+        if format_ in UINT_FORMATS:
+            if isinstance(value, int):
+                raise ValueError(f"Value must be in range [0, {format_.max_value}].") from None
+            expected = "integer"
+        else:
+            expected = "float"
+        raise TypeError(f"Expected {expected} for format {format_.label}, "
+                        f"got {type(value).__name__}") from None
+    except OverflowError:
+        raise ValueError(f"Value is too large for format {format_.label}.") from None
+
+
+def _check_buffer_fits(buffer: bytearray, offset: int, end: int, what: str = "packet"):
+    """
+    Raises a ValueError if the byte range [offset, end) does not lie within `buffer`.
+    """
+    if offset < 0 or end > len(buffer):
+        raise ValueError(f"Buffer too small: {what} needs {end - offset} bytes "
+                         f"at offset {offset}, buffer has {len(buffer)} bytes.")
+
+
 def bytearray_to_hexstring(data: bytearray, use_0x_format: bool = True) -> str:
     """
     Converts a bytearray to a space-separated hex string.
 
     Args:
-        data (bytearray): The bytearray to convert.
+        data (bytearray): The bytearray to convert. Other iterables of integers (e.g., a list)
+                          are also accepted.
         use_0x_format (bool): Whether to include '0x' prefix. Default is True.
 
     Returns:
@@ -147,8 +249,18 @@ def bytearray_to_hexstring(data: bytearray, use_0x_format: bool = True) -> str:
         >>> bytearray_to_hexstring(bytearray([0, 15, 255]), use_0x_format=False)
         '00 0f ff'
     """
-    fmt = "0x{:02x}" if use_0x_format else "{:02x}"
-    return " ".join(fmt.format(x) for x in data)
+    if not isinstance(data, (bytes, bytearray)):
+        # Other iterables are formatted value by value, so they keep accepting
+        # integers that do not fit in a byte
+        fmt = "0x{:02x}" if use_0x_format else "{:02x}"
+        return " ".join(fmt.format(x) for x in data)
+
+    # bytes.hex() formats the whole buffer in C; the separator is then
+    # widened to add the '0x' prefix to every byte in a single replace
+    hex_string = data.hex(" ")
+    if use_0x_format and hex_string:
+        return "0x" + hex_string.replace(" ", " 0x")
+    return hex_string
 
 
 def hexstring_to_bytearray(hex_string: str) -> bytearray:
@@ -170,9 +282,18 @@ def hexstring_to_bytearray(hex_string: str) -> bytearray:
         >>> hexstring_to_bytearray("00 0f ff")
         bytearray(b'\x00\x0f\xff')
     """
-    hex_string = hex_string.strip()
-    if is_0x_format(hex_string):
-        return bytearray(int(token, 16) for token in hex_string.split())
+    tokens = hex_string.split()
+    if _is_0x_tokens(tokens):
+        # When every token is exactly '0x' plus two digits, drop the prefixes and
+        # let bytearray.fromhex() parse the whole string in C. Any other token
+        # width (e.g., "0x1" or "0x1234") goes through int() so it is accepted
+        # or rejected exactly as a per-token parse would.
+        if all(len(token) == 4 for token in tokens):
+            try:
+                return bytearray.fromhex(" ".join(token[2:] for token in tokens))
+            except ValueError:
+                pass
+        return bytearray(int(token, 16) for token in tokens)
     return bytearray.fromhex(hex_string)
 
 
@@ -181,7 +302,8 @@ def bytearray_to_decstring(data: bytearray) -> str:
     Converts a bytearray to a space-separated decimal string.
 
     Args:
-        data (bytearray): The bytearray to convert.
+        data (bytearray): The bytearray to convert. Other iterables of integers (e.g., a list)
+                          are also accepted.
 
     Returns:
         str: A string of zero-padded 3-digit decimal numbers.
@@ -190,7 +312,11 @@ def bytearray_to_decstring(data: bytearray) -> str:
         >>> bytearray_to_decstring(bytearray([1, 15, 255]))
         '001 015 255'
     """
-    return " ".join("{:03d}".format(x) for x in data)
+    if not isinstance(data, (bytes, bytearray)):
+        # Only bytes are guaranteed to be valid _DEC_STRINGS indices; other
+        # iterables may hold negative or larger integers, so format each value
+        return " ".join("{:03d}".format(x) for x in data)
+    return " ".join([_DEC_STRINGS[x] for x in data])
 
 
 def int_to_bytearray(value: int, format_: ValueFormat, byteorder: str = "little") -> bytearray:
@@ -207,37 +333,87 @@ def int_to_bytearray(value: int, format_: ValueFormat, byteorder: str = "little"
 
     Raises:
         ValueError: If value is out of bounds.
+        TypeError: If value is not an integer.
 
     Example:
         >>> int_to_bytearray(1025, ValueFormat.UINT16)
         bytearray(b'\x01\x04')
     """
-    format_ = ValueFormat.coerce(format_)
-    if format_.is_float():
+    if not isinstance(format_, ValueFormat):
+        format_ = ValueFormat.coerce(format_)
+    if format_ in FLOAT_FORMATS:
         raise ValueError("The format cannot be FLOAT32 or FLOAT64.")
+    # Checked before the width/byte order dispatch so every path fails the same way
+    if not isinstance(value, int):
+        raise TypeError(f"Expected integer for format {format_.label}, got {type(value).__name__}")
     if not (0 <= value <= format_.max_value):
         raise ValueError(f"Value must be in range [0, {format_.max_value}].")
+    if format_ is ValueFormat.UINT8:
+        # A single byte has no byte order and needs no struct packing
+        return bytearray((value,))
+    if byteorder == "little":
+        return bytearray(format_.pack_struct.pack(value))
     return bytearray(value.to_bytes(format_.num_bytes, byteorder=byteorder))
 
 
-def bytearray_to_int(value: bytearray, byteorder: str = "little") -> int:
+def ints_to_bytearray(values: Sequence[int], format_: ValueFormat, byteorder: str = "little") -> bytearray:
     """
-    Converts a bytearray to an integer.
+    Converts a sequence of integers into one contiguous bytearray based on a value format.
+
+    All values are packed by a single `struct` call with a repeat count (e.g. '<3H'),
+    rather than one `int_to_bytearray` call per value.
 
     Args:
-        value (bytearray): The input bytearray.
+        values (Sequence[int]): The integer values to convert.
+        format_ (ValueFormat): The format of every value. Cannot be FLOAT32 or FLOAT64.
+        byteorder (str): Byte order ('little' or 'big'). Default is 'little'.
+
+    Returns:
+        bytearray: The packed values, `format_.num_bytes` bytes each.
+
+    Raises:
+        ValueError: If the format is a float format or any value is out of bounds.
+        TypeError: If any value is not an integer.
+
+    Example:
+        >>> ints_to_bytearray([1, 1025], ValueFormat.UINT16)
+        bytearray(b'\\x01\\x00\\x01\\x04')
+    """
+    if not isinstance(format_, ValueFormat):
+        format_ = ValueFormat.coerce(format_)
+    if format_ in FLOAT_FORMATS:
+        raise ValueError("The format cannot be FLOAT32 or FLOAT64.")
+    if values and not (0 <= min(values) and max(values) <= format_.max_value):
+        raise ValueError(f"Values must be in range [0, {format_.max_value}].")
+
+    # e.g. '<3H' for three UINT16 values in little-endian order
+    order = "<" if byteorder == "little" else ">"
+    value_char = format_.pack_struct.format[1:]
+    try:
+        return bytearray(struct.pack(f"{order}{len(values)}{value_char}", *values))
+    except struct.error:
+        raise TypeError("All values must be integers.") from None
+
+
+def bytearray_to_int(value: Union[bytearray, bytes, memoryview], byteorder: str = "little") -> int:
+    """
+    Converts a bytearray (or any other bytes-like object) to an integer.
+
+    Args:
+        value (bytearray | bytes | memoryview): The input bytes.
         byteorder (str): Byte order ('little' or 'big'). Default is 'little'.
 
     Returns:
         int: The resulting integer.
 
+    Raises:
+        TypeError: If input is not a bytes-like object.
+
     Example:
         >>> bytearray_to_int(bytearray([1, 4]))
         1025
     """
-    if not isinstance(value, bytearray):
-        raise TypeError("Input value must be of type bytearray.")
-    return int.from_bytes(value, byteorder=byteorder)
+    return int.from_bytes(_as_byte_buffer(value), byteorder=byteorder)
 
 
 def float_to_bytearray(value: float, precision: ValueFormat, byteorder: str = "little") -> bytearray:
@@ -253,25 +429,104 @@ def float_to_bytearray(value: float, precision: ValueFormat, byteorder: str = "l
         bytearray: Encoded float bytes.
 
     Raises:
-        ValueError: If precision is not a valid float format.
+        ValueError: If precision is not a valid float format, or the value is too large
+                    for FLOAT32.
+        TypeError: If the value is not a number.
 
     Example:
         >>> float_to_bytearray(3.14, ValueFormat.FLOAT32)
         bytearray(b'\\xc3\\xf5H@')
     """
-    precision = ValueFormat.coerce(value=precision)
-    if not precision.is_float():
+    if not isinstance(precision, ValueFormat):
+        precision = ValueFormat.coerce(value=precision)
+    if precision not in FLOAT_FORMATS:
         raise ValueError("The precision must be FLOAT32 or FLOAT64.")
-    packed = struct.pack(precision.format_char, value)
-    return bytearray(packed if byteorder == "little" else packed[::-1])
+    packer = precision.pack_struct if byteorder == "little" else _BIG_ENDIAN_FLOAT_STRUCTS[precision]
+    return bytearray(_pack_checked(packer.pack, precision, value))
+
+
+def int_to_buffer(buffer: bytearray, offset: int, value: int, format_: ValueFormat) -> int:
+    """
+    Writes an integer into a caller-provided buffer in little-endian order.
+
+    Lets callers assemble several fields in one preallocated buffer instead of
+    concatenating a new bytearray per field.
+
+    Args:
+        buffer (bytearray): Writable buffer (e.g., a bytearray or writable memoryview).
+        offset (int): Index in `buffer` at which the value is written.
+        value (int): The integer value to write.
+        format_ (ValueFormat): The format type. Cannot be FLOAT32 or FLOAT64.
+
+    Returns:
+        int: The index in `buffer` immediately after the written value.
+
+    Raises:
+        ValueError: If the format is a float format, the value is out of bounds,
+                    or the value does not fit in `buffer` at `offset`.
+        TypeError: If the value is not an integer.
+
+    Example:
+        >>> buf = bytearray(3)
+        >>> int_to_buffer(buf, 1, 1025, ValueFormat.UINT16)
+        3
+    """
+    if not isinstance(format_, ValueFormat):
+        format_ = ValueFormat.coerce(format_)
+    if format_ in FLOAT_FORMATS:
+        raise ValueError("The format cannot be FLOAT32 or FLOAT64.")
+    if not isinstance(value, int):
+        raise TypeError(f"Expected integer for format {format_.label}, got {type(value).__name__}")
+    if not (0 <= value <= format_.max_value):
+        raise ValueError(f"Value must be in range [0, {format_.max_value}].")
+    return _pack_into_buffer(buffer, offset, value, format_)
+
+
+def float_to_buffer(buffer: bytearray, offset: int, value: float, precision: ValueFormat) -> int:
+    """
+    Writes a float into a caller-provided buffer in little-endian IEEE 754 format.
+
+    Args:
+        buffer (bytearray): Writable buffer (e.g., a bytearray or writable memoryview).
+        offset (int): Index in `buffer` at which the value is written.
+        value (float): The float to write.
+        precision (ValueFormat): Must be FLOAT32 or FLOAT64.
+
+    Returns:
+        int: The index in `buffer` immediately after the written value.
+
+    Raises:
+        ValueError: If precision is not a valid float format, the value is too large
+                    for FLOAT32, or the value does not fit in `buffer` at `offset`.
+        TypeError: If the value is not a number.
+
+    Example:
+        >>> buf = bytearray(4)
+        >>> float_to_buffer(buf, 0, 3.14, ValueFormat.FLOAT32)
+        4
+    """
+    if not isinstance(precision, ValueFormat):
+        precision = ValueFormat.coerce(value=precision)
+    if precision not in FLOAT_FORMATS:
+        raise ValueError("The precision must be FLOAT32 or FLOAT64.")
+    return _pack_into_buffer(buffer, offset, value, precision)
+
+
+def _pack_into_buffer(buffer: bytearray, offset: int, value: Union[int, float], format_: ValueFormat) -> int:
+    """Packs an already validated value into `buffer` at `offset` and returns the end index."""
+    end = offset + format_.num_bytes
+    _check_buffer_fits(buffer, offset, end, "value")
+    _pack_checked(format_.pack_struct.pack_into, format_, buffer, offset, value)
+    return end
 
 
-def bytearray_to_float(value: bytearray, precision: ValueFormat, byteorder: str = "little") -> float:
+def bytearray_to_float(value: Union[bytearray, bytes, memoryview],
+                       precision: ValueFormat, byteorder: str = "little") -> float:
     """
-    Decode a float from a bytearray using IEEE 754 format.
+    Decode a float from a bytearray (or any other bytes-like object) using IEEE 754 format.
 
     Args:
-        value (bytearray): Raw float bytes.
+        value (bytearray | bytes | memoryview): Raw float bytes.
         precision (ValueFormat): Must be FLOAT32 or FLOAT64.
         byteorder (str): Byte order ('little' or 'big').
 
@@ -279,20 +534,20 @@ def bytearray_to_float(value: bytearray, precision: ValueFormat, byteorder: str
         float: Decoded float value.
 
     Raises:
-        TypeError: If input is not a bytearray.
+        TypeError: If input is not a bytes-like object.
         ValueError: If precision is not a valid float format.
 
     Example:
         >>> bytearray_to_float(bytearray(b'\\xc3\\xf5H@'), ValueFormat.FLOAT32)
         3.14
     """
-    if not isinstance(value, bytearray):
-        raise TypeError("Input value must be of type bytearray.")
-    precision = ValueFormat.coerce(value=precision)
-    if not precision.is_float():
+    value = _as_byte_buffer(value)
+    if not isinstance(precision, ValueFormat):
+        precision = ValueFormat.coerce(value=precision)
+    if precision not in FLOAT_FORMATS:
         raise ValueError("The precision must be FLOAT32 or FLOAT64.")
-    byte_seq = bytes(value if byteorder == "little" else value[::-1])
-    return struct.unpack(precision.format_char, byte_seq)[0]
+    unpacker = precision.pack_struct if byteorder == "little" else _BIG_ENDIAN_FLOAT_STRUCTS[precision]
+    return unpacker.unpack(value)[0]
 
 
 def bytearray_to_value(data_: bytearray, format_: ValueFormat) -> Union[int, float]:
@@ -316,10 +571,11 @@ def bytearray_to_value(data_: bytearray, format_: ValueFormat) -> Union[int, flo
         >>> bytearray_to_value(bytearray(struct.pack('f', 3.14)), ValueFormat.FLOAT32)
         3.14
     """
-    format_ = ValueFormat.coerce(format_)
-    if format_.is_uint():
+    if not isinstance(format_, ValueFormat):
+        format_ = ValueFormat.coerce(format_)
+    if format_ in UINT_FORMATS:
         value_ = bytearray_to_int(data_)
-    elif format_.is_float():
+    elif format_ in FLOAT_FORMATS:
         if len(data_) != format_.num_bytes:
             raise ValueError(
                 f"Expected {format_.num_bytes} bytes for float format "
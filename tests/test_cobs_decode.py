@@ -75,7 +75,7 @@ def test_decode_bytearray_max_nonzero_block():
 
 def test_decode_bytearray_large_data():
     """Test decoding a large dataset (512 bytes)"""
-    data = bytearray([i % 256 for i in range(512)])
+    data = bytearray(range(256)) * 2
     encoded = cobs.encode(data)
     assert cobs.decode_bytearray(encoded) == data  # Round-trip test
 
@@ -81,7 +81,7 @@ def test_encode_bytearray_max_nonzero_block():
 
 def test_encode_bytearray_large_data():
     """Test encoding a large dataset (512 bytes)"""
-    data = bytearray([i % 256 for i in range(512)])
+    data = bytearray(range(256)) * 2
     encoded = cobs.encode_bytearray(data)
     assert cobs.decode(encoded) == data  # Round-trip test
 
@@ -134,6 +134,27 @@ def test_encode_invalid_inputs():
         cobs.encode({"key": "value"})
 
 
+def test_encode_many():
+    """Ensure encode_many() matches encode() on each frame"""
+    frames = [[0x00], "01 02 03", bytearray([0x11, 0x00, 0x22]), bytearray(range(1, 256))]
+    assert cobs.encode_many(frames) == [cobs.encode(frame) for frame in frames]
+    assert cobs.encode_many([]) == []
+    with pytest.raises(TypeError):
+        cobs.encode_many([bytearray([0x01]), 123])
+    with pytest.raises(ValueError):
+        cobs.encode_many([bytearray()])
+
+
+def test_encode_many_literal():
+    """Ensure encode_many() produces the expected COBS frames"""
+    frames = [[0x00], "11 00 22", bytearray([0x11, 0x22])]
+    assert cobs.encode_many(frames) == [
+        bytearray([0x01, 0x00]),
+        bytearray([0x02, 0x11, 0x02, 0x22, 0x00]),
+        bytearray([0x03, 0x11, 0x22, 0x00]),
+    ]
+
+
 # Advanced Encode/Decode Tests
 @given(st.binary(min_size=1, max_size=512))
 def test_cobs_encode_decode_round_trip_hypothesis(data):
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import crc
 import pytest
 from serial_protocol import packet, utils
 
@@ -39,6 +40,43 @@ def test_serial_packet_constructor_invalid_values(invalid_length):
         packet.SerialPacket(max_data_length=invalid_length)
 
 
+@pytest.mark.parametrize("invalid_crc_format", [
+    utils.ValueFormat.FLOAT32,
+    "float64",
+    None,
+])
+def test_serial_packet_constructor_invalid_crc_format(invalid_crc_format):
+    """Test constructor raises for a non-uint crc_format."""
+    with pytest.raises(ValueError):
+        packet.SerialPacket(crc_format=invalid_crc_format)
+
+
+@pytest.mark.parametrize("crc_, crc_format", [
+    (crc.Crc16.XMODEM, utils.ValueFormat.UINT8),
+    (crc.Crc32.CRC32, utils.ValueFormat.UINT16),
+    (crc.Crc32.CRC32.value, utils.ValueFormat.UINT16),
+])
+def test_serial_packet_constructor_crc_format_too_small(crc_, crc_format):
+    """Test constructor raises if the CRC does not fit in crc_format."""
+    with pytest.raises(ValueError):
+        packet.SerialPacket(crc_=crc_, crc_format=crc_format)
+
+
+def test_serial_packet_crc32():
+    """A 32-bit CRC round-trips with a uint32 crc_format."""
+    sp = packet.SerialPacket(crc_=crc.Crc32.CRC32, crc_format=utils.ValueFormat.UINT32)
+    encoded = sp.encode(1, 123, utils.ValueFormat.UINT8)
+    assert len(encoded) == 3 + 4
+    assert sp.decode(encoded, utils.ValueFormat.UINT8).value_ == 123
+
+
+def test_serial_packet_slots():
+    sp = packet.SerialPacket()
+    assert not hasattr(sp, "__dict__")
+    with pytest.raises(AttributeError):
+        sp.unknown_attribute = 1
+
+
 # --- Encode Tests --- #
 
 @pytest.mark.parametrize("maxlen, type_, value_, fmt, expected", [
@@ -76,6 +114,83 @@ def test_encode_with_cobs_encoding(maxlen, dev_id, type_, value_, fmt, expected)
     assert sp.encode(struct, cobs_encode=True) == expected
 
 
+def test_encode_batch_matches_encode():
+    """Batch encoding returns the same packets as encoding one at a time."""
+    sp = packet.SerialPacket()
+    structs = [
+        packet.SerialPacketStruct(type_=1, value_=123, format_=utils.ValueFormat.UINT8),
+        packet.SerialPacketStruct(device_id=20, type_=2, value_=3.14, format_=utils.ValueFormat.FLOAT32),
+        packet.SerialPacketStruct(type_=3, value_=bytearray([0x00, 0x01]), format_=utils.ValueFormat.UINT8),
+    ]
+    for cobs_encode in (False, True):
+        expected = [sp.encode(struct, cobs_encode=cobs_encode) for struct in structs]
+        assert sp.encode_batch(structs, cobs_encode=cobs_encode) == expected
+
+
+def test_encode_batch_literal():
+    """Batch encoding produces the expected packet bytes."""
+    sp = packet.SerialPacket()
+    structs = [
+        packet.SerialPacketStruct(type_=1, value_=123, format_=utils.ValueFormat.UINT8),
+        packet.SerialPacketStruct(device_id=20, type_=2, value_=1.5, format_=utils.ValueFormat.FLOAT32),
+    ]
+    assert sp.encode_batch(structs) == [
+        bytearray([0x01, 0x01, 0x7b, 0xfd, 0xcb]),
+        bytearray([0x14, 0x02, 0x04, 0x00, 0x00, 0xc0, 0x3f, 0x13, 0x25]),
+    ]
+    assert sp.encode_batch(structs[:1], cobs_encode=True) == [
+        bytearray([0x06, 0x01, 0x01, 0x7b, 0xfd, 0xcb, 0x00]),
+    ]
+
+
+def test_encode_batch_invalid_item():
+    """Batch encoding rejects items that are not SerialPacketStruct."""
+    sp = packet.SerialPacket()
+    with pytest.raises(ValueError):
+        sp.encode_batch([1])
+
+
+@pytest.mark.parametrize("device_id, cobs_encode", [(None, False), (20, False), (None, True), (20, True)])
+def test_encode_into_matches_encode(device_id, cobs_encode):
+    """Encoding into a buffer writes the same bytes as encode()."""
+    sp = packet.SerialPacket(max_data_length=utils.ValueFormat.UINT16)
+    struct = packet.SerialPacketStruct(device_id=device_id, type_=1, value_=1025,
+                                       format_=utils.ValueFormat.UINT16)
+    expected = sp.encode(struct, cobs_encode=cobs_encode)
+    buffer = bytearray(2 + 2 * len(expected))
+    end = sp.encode_into(buffer, 2, struct, cobs_encode=cobs_encode)
+    end = sp.encode_into(buffer, end, 1, 1025, utils.ValueFormat.UINT16,
+                         device_id=device_id, cobs_encode=cobs_encode)
+    assert end == len(buffer)
+    assert buffer == bytearray(2) + expected + expected
+
+
+@pytest.mark.parametrize("cobs_encode, expected_end, expected", [
+    (False, 9, bytearray([0x00, 0x14, 0x01, 0x02, 0x00, 0x01, 0x04, 0xa9, 0x28, 0x00, 0x00])),
+    (True, 11, bytearray([0x00, 0x04, 0x14, 0x01, 0x02, 0x05, 0x01, 0x04, 0xa9, 0x28, 0x00])),
+])
+def test_encode_into_literal(cobs_encode, expected_end, expected):
+    """Encoding into a buffer writes the expected packet bytes at the offset."""
+    sp = packet.SerialPacket(max_data_length=utils.ValueFormat.UINT16)
+    buffer = bytearray(len(expected))
+    end = sp.encode_into(buffer, 1, 1, 1025, utils.ValueFormat.UINT16,
+                         device_id=20, cobs_encode=cobs_encode)
+    assert end == expected_end
+    assert buffer == expected
+
+
+@pytest.mark.parametrize("buffer_size, offset, cobs_encode", [
+    (4, 0, False), (5, 1, False), (8, -1, False), (5, 0, True),
+])
+def test_encode_into_buffer_too_small(buffer_size, offset, cobs_encode):
+    """A packet that does not fit raises and leaves the buffer untouched."""
+    sp = packet.SerialPacket()
+    buffer = bytearray(buffer_size)
+    with pytest.raises(ValueError):
+        sp.encode_into(buffer, offset, 1, 123, utils.ValueFormat.UINT8, cobs_encode=cobs_encode)
+    assert buffer == bytearray(buffer_size)
+
+
 # --- Decode Tests --- #
 
 def test_decode_return_type():
@@ -132,12 +247,13 @@ def corrupt_checksum(data: bytearray) -> bytearray:
     return corrupted
 
 
-def test_decode_checksum_failure():
+@pytest.mark.parametrize("crc_format", [utils.ValueFormat.UINT16, utils.ValueFormat.UINT32])
+def test_decode_checksum_failure(crc_format):
     """Corrupted checksum should raise ValueError."""
-    sp = packet.SerialPacket()
+    sp = packet.SerialPacket(crc_format=crc_format)
     encoded = sp.encode(1, 123, utils.ValueFormat.UINT8)
     corrupted = corrupt_checksum(encoded)
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Checksum verification failed"):
         sp.decode(corrupted, utils.ValueFormat.UINT8)
 
 
@@ -158,3 +274,15 @@ def test_decode_invalid_cobs_data():
     bad_cobs = bytearray([0x03, 0x01, 0x00, 0x7b, 0xfd, 0xcb])  # includes forbidden 0x00
     with pytest.raises(ValueError):
         sp.decode(bad_cobs, utils.ValueFormat.UINT8, cobs_encoded=True)
+
+
+@pytest.mark.parametrize("short_packet", [
+    bytearray([]),
+    bytearray([0x01]),
+    bytearray([0x00, 0x00]),
+])
+def test_decode_packet_too_short(short_packet):
+    """Packets too short for a checksum or TLV header should raise ValueError."""
+    sp = packet.SerialPacket()
+    with pytest.raises(ValueError):
+        sp.decode(short_packet, utils.ValueFormat.UINT8)
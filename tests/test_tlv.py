@@ -36,6 +36,13 @@ def test_invalid_constructor_values(attr, value):
         tlv.TLVPacket(**{attr: value})
 
 
+def test_slots():
+    packet = tlv.TLVPacket()
+    assert not hasattr(packet, "__dict__")
+    with pytest.raises(AttributeError):
+        packet.unknown_attribute = 1
+
+
 # --- PROPERTY TESTS --- #
 
 
@@ -51,6 +58,7 @@ def test_valid_setters(attr, values):
 
 @pytest.mark.parametrize("attr, invalid_value", [
     ("max_data_length", "FLOAT64"),
+    ("max_data_length", utils.ValueFormat.FLOAT32),
 ])
 def test_invalid_setters(attr, invalid_value):
     packet = tlv.TLVPacket()
@@ -99,6 +107,160 @@ def test_raw_bytearray_decode():
     assert decoded == (5, length, value_bytes)
 
 
+def test_encode_into_matches_encode():
+    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT16)
+    expected = packet.encode(7, 1025, utils.ValueFormat.UINT16)
+    buffer = bytearray(2 + 2 * len(expected))
+    end = packet.encode_into(buffer, 2, 7, 1025, utils.ValueFormat.UINT16)
+    assert end == 2 + len(expected)
+    end = packet.encode_into(buffer, end, 7, 1025, utils.ValueFormat.UINT16)
+    assert end == len(buffer)
+    assert buffer == bytearray(2) + expected + expected
+
+
+def test_encode_into_literal():
+    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT16)
+    buffer = bytearray(7)
+    end = packet.encode_into(buffer, 1, 7, 1025, utils.ValueFormat.UINT16)
+    assert end == 6
+    assert buffer == bytearray([0x00, 0x07, 0x02, 0x00, 0x01, 0x04, 0x00])
+
+
+@pytest.mark.parametrize("max_length, types, values, format_, expected", [
+    (utils.ValueFormat.UINT8, [1, 2], [42, 7], utils.ValueFormat.UINT8,
+     bytearray([0x01, 0x01, 0x2A, 0x02, 0x01, 0x07])),
+    (utils.ValueFormat.UINT8, [3], [1.5], utils.ValueFormat.FLOAT32,
+     bytearray([0x03, 0x04, 0x00, 0x00, 0xC0, 0x3F])),
+    (utils.ValueFormat.UINT16, [7, 8], [bytearray([0x00, 0x01]), bytearray()], utils.ValueFormat.UINT8,
+     bytearray([0x07, 0x02, 0x00, 0x00, 0x01, 0x08, 0x00, 0x00])),
+])
+def test_encode_many_literal(max_length, types, values, format_, expected):
+    packet = tlv.TLVPacket(max_data_length=max_length)
+    assert packet.encode_many(types, values, format_) == expected
+
+
+@pytest.mark.parametrize("format_, values", [
+    (utils.ValueFormat.UINT16, [0, 1025, 65535]),
+    (utils.ValueFormat.FLOAT64, [0.0, -1.5, 3.14]),
+    (utils.ValueFormat.UINT8, [bytearray([0xAB]), bytearray(), bytearray([0x00, 0x01])]),
+])
+def test_encode_many_matches_encode(format_, values):
+    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT16)
+    types = list(range(len(values)))
+    expected = bytearray().join(packet.encode(t, v, format_) for t, v in zip(types, values))
+    assert packet.encode_many(types, values, format_) == expected
+
+
+def test_encode_many_length_mismatch():
+    packet = tlv.TLVPacket()
+    with pytest.raises(ValueError):
+        packet.encode_many([1, 2], [1], utils.ValueFormat.UINT8)
+
+
+@pytest.mark.parametrize("format_, expected", [
+    (utils.ValueFormat.UINT16, [(1, 1, 42), (2, 2, 1025)]),
+    (None, [(1, 1, bytearray([0x2A])), (2, 2, bytearray([0x01, 0x04]))]),
+])
+def test_decode_many_literal(format_, expected):
+    stream = bytes([0x01, 0x01, 0x2A, 0x02, 0x02, 0x01, 0x04])
+    assert tlv.TLVPacket().decode_many(stream, format_) == expected
+
+
+@pytest.mark.parametrize("format_, values", [
+    (utils.ValueFormat.UINT32, [0, 1, 4294967295]),
+    (utils.ValueFormat.FLOAT64, [0.0, 3.5, -1.25]),
+    (None, [bytearray([0x01]), bytearray(), bytearray([0x02, 0x03])]),
+])
+def test_decode_many_matches_decode(format_, values):
+    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT16)
+    types = list(range(len(values)))
+    stream = packet.encode_many(types, values, format_ or utils.ValueFormat.UINT8)
+    decoded = packet.decode_many(bytes(stream), format_)
+    assert decoded == [packet.decode(packet.encode(t, v, format_ or utils.ValueFormat.UINT8), format_)
+                       for t, v in zip(types, values)]
+    assert packet.decode_many(bytearray()) == []
+
+
+@pytest.mark.parametrize("stream", [
+    bytearray([0x01]),                    # truncated header
+    bytearray([0x01, 0x02, 0x2A]),        # truncated value
+    bytearray([0x01, 0x01, 0x2A, 0x02]),  # trailing partial packet
+])
+def test_decode_many_truncated(stream):
+    with pytest.raises(ValueError):
+        tlv.TLVPacket().decode_many(stream)
+
+
+@pytest.mark.parametrize("buffer_size, offset", [(2, 0), (4, 2), (8, -1)])
+def test_encode_into_buffer_too_small(buffer_size, offset):
+    packet = tlv.TLVPacket()
+    buffer = bytearray(buffer_size)
+    with pytest.raises(ValueError):
+        packet.encode_into(buffer, offset, 1, 42, utils.ValueFormat.UINT8)
+    assert buffer == bytearray(buffer_size)
+
+
+def test_raw_decode_without_copy():
+    packet = tlv.TLVPacket()
+    encoded = packet.encode(5, bytearray([0xAB, 0xCD]), utils.ValueFormat.UINT8)
+    type_, length, value = packet.decode(encoded, copy=False)
+    assert (type_, length) == (5, 2)
+    assert isinstance(value, memoryview)
+    assert value == bytearray([0xAB, 0xCD])
+    encoded[-1] = 0xEF  # the view aliases the packet buffer
+    assert value == bytearray([0xAB, 0xEF])
+
+
+@pytest.mark.parametrize("max_length, format_, value_", [
+    (utils.ValueFormat.UINT8, utils.ValueFormat.UINT8, 200),
+    (utils.ValueFormat.UINT16, utils.ValueFormat.UINT16, 1025),
+    (utils.ValueFormat.UINT32, utils.ValueFormat.UINT32, 4294967295),
+    (utils.ValueFormat.UINT8, utils.ValueFormat.FLOAT32, 3.14),
+    (utils.ValueFormat.UINT16, utils.ValueFormat.FLOAT64, -1.5),
+    (utils.ValueFormat.UINT8, utils.ValueFormat.UINT8, bytearray([0x00, 0x01])),
+])
+def test_tlv_encoder_matches_tlv_packet(max_length, format_, value_):
+    encoder = tlv.TLVEncoder(9, format_, max_data_length=max_length)
+    packet = tlv.TLVPacket(max_data_length=max_length)
+    assert encoder.type_ == 9
+    assert encoder.format_ == format_
+    assert encoder.max_data_length == max_length
+    assert encoder.encode(value_) == packet.encode(9, value_, format_)
+
+
+@pytest.mark.parametrize("type_, format_, max_length, value_, expected", [
+    (1, utils.ValueFormat.UINT16, utils.ValueFormat.UINT8, 300, bytearray([0x01, 0x02, 0x2C, 0x01])),
+    (2, utils.ValueFormat.FLOAT32, utils.ValueFormat.UINT16, 1.5,
+     bytearray([0x02, 0x04, 0x00, 0x00, 0x00, 0xC0, 0x3F])),
+])
+def test_tlv_encoder_literal(type_, format_, max_length, value_, expected):
+    encoder = tlv.TLVEncoder(type_, format_, max_data_length=max_length)
+    assert encoder.encode(value_) == expected
+
+
+@pytest.mark.parametrize("format_, value_, error", [
+    (utils.ValueFormat.UINT8, 256, ValueError),
+    (utils.ValueFormat.UINT16, -1, ValueError),
+    (utils.ValueFormat.UINT8, 3.14, TypeError),
+    (utils.ValueFormat.FLOAT32, 1, TypeError),
+])
+def test_tlv_encoder_invalid_value(format_, value_, error):
+    encoder = tlv.TLVEncoder(1, format_)
+    with pytest.raises(error):
+        encoder.encode(value_)
+
+
+@pytest.mark.parametrize("wrap", [bytes, memoryview, lambda data: memoryview(bytes(data))])
+def test_decode_buffer_protocol_inputs(wrap):
+    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT16)
+    encoded = packet.encode(3, 1025, utils.ValueFormat.UINT16)
+    assert packet.decode(wrap(encoded), value_format=utils.ValueFormat.UINT16) == (3, 2, 1025)
+    type_, length, value = packet.decode(wrap(encoded))
+    assert (type_, length) == (3, 2)
+    assert isinstance(value, bytearray)
+    assert value == bytearray([0x01, 0x04])
+
+
 # --- ERROR TESTS --- #
 
 
@@ -135,6 +297,70 @@ def test_encode_int_out_of_range():
         packet.encode(1, 256, utils.ValueFormat.UINT8)
 
 
+@pytest.mark.parametrize("value_", [1e39, -1e39])
+def test_encode_float32_out_of_range(value_):
+    packet = tlv.TLVPacket()
+    format_ = utils.ValueFormat.FLOAT32
+    with pytest.raises(ValueError, match="too large"):
+        packet.encode(1, value_, format_)
+    with pytest.raises(ValueError, match="too large"):
+        packet.encode_bytes(1, value_, format_)
+    with pytest.raises(ValueError, match="too large"):
+        packet.encode_into(bytearray(8), 0, 1, value_, format_)
+    with pytest.raises(ValueError, match="too large"):
+        tlv.TLVEncoder(1, format_).encode(value_)
+    # FLOAT64 has the range to hold the same value
+    encoded = packet.encode(1, value_, utils.ValueFormat.FLOAT64)
+    assert packet.decode(encoded, utils.ValueFormat.FLOAT64)[2] == value_
+
+
+@pytest.mark.parametrize("format_, value_", [
+    (utils.ValueFormat.UINT16, 513),
+    (utils.ValueFormat.FLOAT64, 3.5),
+])
+def test_encode_fast_path_matches_general_path(format_, value_):
+    packet = tlv.TLVPacket()
+    # String formats and bytearray types skip the whole-packet struct
+    expected = packet.encode(bytearray([7]), value_, format_.label)
+    assert packet.encode(7, value_, format_) == expected
+    packet.max_data_length = utils.ValueFormat.UINT32
+    assert packet.encode(7, value_, format_) == packet.encode(bytearray([7]), value_, format_.label)
+
+
+@pytest.mark.parametrize("type_, value_, format_", [
+    (7, 513, utils.ValueFormat.UINT16),
+    (7, 3.5, utils.ValueFormat.FLOAT32),
+    (bytearray([7]), 3.5, "float64"),
+    (7, bytearray([0x00, 0x01]), utils.ValueFormat.UINT8),
+])
+def test_encode_bytes_matches_encode(type_, value_, format_):
+    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT16)
+    encoded = packet.encode_bytes(type_, value_, format_)
+    assert type(encoded) is bytes
+    assert encoded == packet.encode(type_, value_, format_)
+
+
+@pytest.mark.parametrize("max_length, type_, value_, format_, expected", [
+    (utils.ValueFormat.UINT8, 1, 42, utils.ValueFormat.UINT8, b"\x01\x01\x2a"),
+    (utils.ValueFormat.UINT16, 7, bytearray([0x00, 0x01]), utils.ValueFormat.UINT8, b"\x07\x02\x00\x00\x01"),
+])
+def test_encode_bytes_literal(max_length, type_, value_, format_, expected):
+    packet = tlv.TLVPacket(max_data_length=max_length)
+    assert packet.encode_bytes(type_, value_, format_) == expected
+
+
+@pytest.mark.parametrize("type_, value_, error", [(256, 1, ValueError), (1, 256, ValueError), (1, "x", TypeError)])
+def test_encode_bytes_invalid(type_, value_, error):
+    with pytest.raises(error):
+        tlv.TLVPacket().encode_bytes(type_, value_, utils.ValueFormat.UINT8)
+
+
+def test_encode_value_too_long_for_length_field():
+    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT8)
+    with pytest.raises(ValueError):
+        packet.encode(1, bytearray(256), utils.ValueFormat.UINT8)
+
+
 def test_decode_float_size_mismatch():
     packet = tlv.TLVPacket()
     format_ = utils.ValueFormat.FLOAT32
@@ -159,24 +385,21 @@ def test_decode_type_error():
 
 # --- UINT FUZZ TESTS --- #
 
-uint_strategies = {
-    utils.ValueFormat.UINT8: st.integers(min_value=0, max_value=2**8 - 1),
-    utils.ValueFormat.UINT16: st.integers(min_value=0, max_value=2**16 - 1),
-    utils.ValueFormat.UINT32: st.integers(min_value=0, max_value=2**32 - 1),
-}
+@pytest.fixture(scope="module")
+def fuzz_packet():
+    """A single TLVPacket shared across every fuzz example rather than built per example."""
+    return tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT8)
 
 
 @pytest.mark.parametrize("format_", [utils.ValueFormat.UINT8, utils.ValueFormat.UINT16, utils.ValueFormat.UINT32])
-@given(type_=st.integers(min_value=0, max_value=255),
-       data=st.integers(min_value=0, max_value=2**32 - 1))
-def test_fuzz_encode_decode_uints(type_, data, format_):
-    if data > format_.max_value:
-        pytest.skip("Filtered to avoid over-range value for format")
-    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT8)
-    encoded = packet.encode(type_, data, format_)
-    decoded = packet.decode(encoded, value_format=format_)
+@given(type_=st.integers(min_value=0, max_value=255), data=st.data())
+def test_fuzz_encode_decode_uint(fuzz_packet, format_, type_, data):
+    # Draw within the format's range so no example is rejected as out of range
+    value_ = data.draw(st.integers(min_value=0, max_value=format_.max_value))
+    encoded = fuzz_packet.encode(type_, value_, format_)
+    decoded = fuzz_packet.decode(encoded, value_format=format_)
     assert decoded[0] == type_
-    assert decoded[2] == data
+    assert decoded[2] == value_
 
 
 # --- FLOAT FUZZ TESTS --- #
@@ -191,11 +414,10 @@ def test_fuzz_encode_decode_uints(type_, data, format_):
         width=64
     )
 )
-def test_fuzz_encode_decode_float32(type_, data):
+def test_fuzz_encode_decode_float32(fuzz_packet, type_, data):
     format_ = utils.ValueFormat.FLOAT32
-    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT8)
-    encoded = packet.encode(type_, data, format_)
-    decoded = packet.decode(encoded, value_format=format_)
+    encoded = fuzz_packet.encode(type_, data, format_)
+    decoded = fuzz_packet.decode(encoded, value_format=format_)
     assert decoded[0] == type_
     assert math.isclose(decoded[2], data, rel_tol=1e-5, abs_tol=1e-5)
 
@@ -210,10 +432,9 @@ def test_fuzz_encode_decode_float32(type_, data):
         width=64
     )
 )
-def test_fuzz_encode_decode_float64(type_, data):
+def test_fuzz_encode_decode_float64(fuzz_packet, type_, data):
     format_ = utils.ValueFormat.FLOAT64
-    packet = tlv.TLVPacket(max_data_length=utils.ValueFormat.UINT8)
-    encoded = packet.encode(type_, data, format_)
-    decoded = packet.decode(encoded, value_format=format_)
+    encoded = fuzz_packet.encode(type_, data, format_)
+    decoded = fuzz_packet.decode(encoded, value_format=format_)
     assert decoded[0] == type_
     assert math.isclose(decoded[2], data, rel_tol=1e-5, abs_tol=1e-5)
@@ -33,6 +33,12 @@ def test_coerce_from_label():
     assert utils.ValueFormat.coerce("float32") == utils.ValueFormat.FLOAT32
 
 
+@pytest.mark.parametrize("invalid", ["UINT8", "", None, 1, [1], ("uint8",)])
+def test_coerce_invalid(invalid):
+    with pytest.raises(ValueError):
+        utils.ValueFormat.coerce(invalid)
+
+
 def test_max_value_for_uints():
     for vf in utils.ValueFormat:
         if vf.is_uint():
@@ -41,6 +47,24 @@ def test_max_value_for_uints():
             assert vf.max_value is None
 
 
+def test_format_category_sets():
+    assert utils.UINT_FORMATS == {vf for vf in utils.ValueFormat if vf.is_uint()}
+    assert utils.FLOAT_FORMATS == {vf for vf in utils.ValueFormat if vf.is_float()}
+    assert utils.UINT_FORMATS.isdisjoint(utils.FLOAT_FORMATS)
+
+
+def test_pack_struct():
+    for vf in utils.ValueFormat:
+        assert vf.pack_struct.size == vf.num_bytes
+        assert vf.pack_struct.format.startswith("<")
+
+
+@pytest.mark.parametrize("attr", ["num_bytes", "category", "label", "format_char", "max_value", "pack_struct"])
+def test_value_format_attributes_read_only(attr):
+    with pytest.raises(AttributeError):
+        setattr(utils.ValueFormat.UINT8, attr, None)
+
+
 # --- Hex/Dec String Conversion ---
 def test_hexstring_to_bytearray():
     data = bytearray([0x00, 0x11, 0x22])
@@ -48,10 +72,22 @@ def test_hexstring_to_bytearray():
     assert utils.hexstring_to_bytearray("0x00 0x11 0x22") == data
 
 
+@pytest.mark.parametrize("hex_string", ["0x1234", "0x0102 0x03", "0x0x01", "0x 0x"])
+def test_hexstring_to_bytearray_invalid(hex_string):
+    with pytest.raises(ValueError):
+        utils.hexstring_to_bytearray(hex_string)
+
+
 def test_bytearray_to_hexstring():
     data = bytearray([0x00, 0x11, 0x22])
     assert utils.bytearray_to_hexstring(data) == "0x00 0x11 0x22"
     assert utils.bytearray_to_hexstring(data, False) == "00 11 22"
+    assert utils.bytearray_to_hexstring(bytearray([0xff])) == "0xff"
+    assert utils.bytearray_to_hexstring(bytearray()) == ""
+    assert utils.bytearray_to_hexstring(bytearray(), False) == ""
+    assert utils.bytearray_to_hexstring(b"\x00\x11") == "0x00 0x11"
+    assert utils.bytearray_to_hexstring([0, 17, 255]) == "0x00 0x11 0xff"
+    assert utils.bytearray_to_hexstring([1, 256], False) == "01 100"
 
 
 def test_is_0x_format():
@@ -59,11 +95,18 @@ def test_is_0x_format():
     assert utils.is_0x_format("00 11 22") is False
     with pytest.raises(ValueError):
         utils.is_0x_format("00 0x11 22")
+    assert utils.is_0x_format(" 0x00\t0x11\n 0x22 ") is True
+    assert utils.is_0x_format("a0x1 10x2") is False
+    with pytest.raises(ValueError):
+        utils.is_0x_format("0x00  a0x1")
 
 
 def test_bytearray_to_decstring():
     assert utils.bytearray_to_decstring(bytearray([0, 17, 255])) == "000 017 255"
     assert utils.bytearray_to_decstring(bytearray([1, 2, 3, 4, 5])) == "001 002 003 004 005"
+    assert utils.bytearray_to_decstring(b"\x00\xff") == "000 255"
+    assert utils.bytearray_to_decstring([0, 17, 255]) == "000 017 255"
+    assert utils.bytearray_to_decstring([256, -1]) == "256 -01"
 
 
 # --- Integer Conversion ---
@@ -80,6 +123,7 @@ def test_bytearray_to_decstring():
 ])
 def test_int_to_bytearray(value, format_, expected):
     assert utils.int_to_bytearray(value, format_) == expected
+    assert utils.int_to_bytearray(value, format_, byteorder="big") == expected[::-1]
 
 
 @pytest.mark.parametrize("value, max_value", [
@@ -93,6 +137,13 @@ def test_int_to_bytearray_invalid(value, max_value):
         utils.int_to_bytearray(value, max_value)
 
 
+@pytest.mark.parametrize("format_", [utils.ValueFormat.UINT8, utils.ValueFormat.UINT16, utils.ValueFormat.UINT32])
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_int_to_bytearray_non_int_value(format_, byteorder):
+    with pytest.raises(TypeError, match=f"Expected integer for format {format_.label}"):
+        utils.int_to_bytearray(1.0, format_, byteorder=byteorder)
+
+
 @pytest.mark.parametrize("value, max_value", [
     (8, 999999),
     (8, "UINT8"),
@@ -103,6 +154,26 @@ def test_int_to_bytearray_invalid_max_value(value, max_value):
         utils.int_to_bytearray(value, max_value)
 
 
+@pytest.mark.parametrize("format_", [utils.ValueFormat.UINT8, utils.ValueFormat.UINT16, utils.ValueFormat.UINT32])
+def test_ints_to_bytearray(format_):
+    values = [0, 1, 200, format_.max_value]
+    for byteorder in ("little", "big"):
+        expected = bytearray().join(utils.int_to_bytearray(v, format_, byteorder) for v in values)
+        assert utils.ints_to_bytearray(values, format_, byteorder) == expected
+    assert utils.ints_to_bytearray([], format_) == bytearray()
+
+
+@pytest.mark.parametrize("values, format_, error", [
+    ([1, 256], utils.ValueFormat.UINT8, ValueError),
+    ([-1], utils.ValueFormat.UINT16, ValueError),
+    ([1], utils.ValueFormat.FLOAT32, ValueError),
+    ([1, 2.5], utils.ValueFormat.UINT8, TypeError),
+])
+def test_ints_to_bytearray_invalid(values, format_, error):
+    with pytest.raises(error):
+        utils.ints_to_bytearray(values, format_)
+
+
 # --- Float Conversion ---
 @pytest.mark.parametrize("value, precision, expected", [
     (3.14, utils.ValueFormat.FLOAT32, bytearray(struct.pack('f', 3.14))),
@@ -112,6 +183,7 @@ def test_int_to_bytearray_invalid_max_value(value, max_value):
 ])
 def test_float_to_bytearray(value, precision, expected):
     assert utils.float_to_bytearray(value, precision) == expected
+    assert utils.float_to_bytearray(value, precision, byteorder="big") == expected[::-1]
 
 
 @pytest.mark.parametrize("value, precision", [
@@ -128,6 +200,28 @@ def test_float_to_bytearray_invalid(value, precision):
         utils.float_to_bytearray(value, precision)
 
 
+@pytest.mark.parametrize("value", ["x", None, [1.5]])
+def test_float_helpers_non_float_value(value):
+    with pytest.raises(TypeError, match="Expected float for format float32"):
+        utils.float_to_bytearray(value, utils.ValueFormat.FLOAT32)
+    buffer = bytearray(4)
+    with pytest.raises(TypeError, match="Expected float for format float32"):
+        utils.float_to_buffer(buffer, 0, value, utils.ValueFormat.FLOAT32)
+    assert buffer == bytearray(4)
+
+
+@pytest.mark.parametrize("value", [1e39, -1e39])
+def test_float32_out_of_range(value):
+    for byteorder in ("little", "big"):
+        with pytest.raises(ValueError, match="too large"):
+            utils.float_to_bytearray(value, utils.ValueFormat.FLOAT32, byteorder=byteorder)
+    buffer = bytearray(4)
+    with pytest.raises(ValueError, match="too large"):
+        utils.float_to_buffer(buffer, 0, value, utils.ValueFormat.FLOAT32)
+    assert buffer == bytearray(4)
+    assert utils.float_to_bytearray(value, utils.ValueFormat.FLOAT64) == bytearray(struct.pack('<d', value))
+
+
 @pytest.mark.parametrize("value, precision", [
     (bytearray(struct.pack('f', 3.14)), utils.ValueFormat.FLOAT32),
     (bytearray(struct.pack('d', 3.14)), utils.ValueFormat.FLOAT64)
@@ -138,6 +232,67 @@ def test_bytearray_to_float(value, precision):
     assert abs(result - 3.14) < 1e-6
 
 
+@pytest.mark.parametrize("make_buffer", [bytearray, bytes, memoryview])
+def test_bytes_like_inputs(make_buffer):
+    assert utils.bytearray_to_int(make_buffer(b"\x01\x04")) == 1025
+    assert utils.bytearray_to_int(make_buffer(b"\x01\x04"), byteorder="big") == 260
+    packed = struct.pack('<f', 3.14)
+    assert utils.bytearray_to_float(make_buffer(packed), utils.ValueFormat.FLOAT32) == pytest.approx(3.14)
+    assert utils.bytearray_to_float(make_buffer(packed[::-1]), utils.ValueFormat.FLOAT32,
+                                    byteorder="big") == pytest.approx(3.14)
+
+
+@pytest.mark.parametrize("value", [[1, 4], "0104", 1025])
+def test_bytes_like_inputs_invalid(value):
+    with pytest.raises(TypeError):
+        utils.bytearray_to_int(value)
+    with pytest.raises(TypeError):
+        utils.bytearray_to_float(value, utils.ValueFormat.FLOAT32)
+
+
+def test_value_to_buffer():
+    buffer = bytearray(1 + 2 + 8)
+    end = utils.int_to_buffer(buffer, 1, 1025, utils.ValueFormat.UINT16)
+    assert end == 3
+    end = utils.float_to_buffer(buffer, end, 3.14, utils.ValueFormat.FLOAT64)
+    assert end == len(buffer)
+    assert buffer == (bytearray(1) + utils.int_to_bytearray(1025, utils.ValueFormat.UINT16)
+                      + utils.float_to_bytearray(3.14, utils.ValueFormat.FLOAT64))
+
+
+@pytest.mark.parametrize("offset, value, format_", [
+    (0, 256, utils.ValueFormat.UINT8),
+    (0, 1, utils.ValueFormat.FLOAT32),
+    (1, 1, utils.ValueFormat.UINT32),
+    (-1, 1, utils.ValueFormat.UINT8),
+])
+def test_int_to_buffer_invalid(offset, value, format_):
+    buffer = bytearray(4)
+    with pytest.raises(ValueError):
+        utils.int_to_buffer(buffer, offset, value, format_)
+    assert buffer == bytearray(4)
+
+
+@pytest.mark.parametrize("value", [1.5, "1", None])
+def test_int_to_buffer_non_int_value(value):
+    buffer = bytearray(4)
+    with pytest.raises(TypeError, match="Expected integer for format uint16"):
+        utils.int_to_buffer(buffer, 0, value, utils.ValueFormat.UINT16)
+    assert buffer == bytearray(4)
+
+
+@pytest.mark.parametrize("offset, precision", [
+    (0, utils.ValueFormat.UINT32),
+    (1, utils.ValueFormat.FLOAT32),
+    (0, utils.ValueFormat.FLOAT64),
+])
+def test_float_to_buffer_invalid(offset, precision):
+    buffer = bytearray(4)
+    with pytest.raises(ValueError):
+        utils.float_to_buffer(buffer, offset, 1.5, precision)
+    assert buffer == bytearray(4)
+
+
 # --- Generic Conversion --- #
 @pytest.mark.parametrize("format_, value, expected", [
     (utils.ValueFormat.UINT8, bytearray([0x2A]), 42),